@@ -3,13 +3,27 @@
 #
 
 
+import sys
 from http import HTTPStatus
-from typing import List
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Tuple
 
 from .report_streams import ReportInfo, ReportStream
 
-METRICS_MAP = {
-    "campaigns": [
+_ATTRIBUTION_WINDOWS = ("1d", "7d", "14d", "30d")
+
+
+def _windowed(*metrics: str) -> Tuple[str, ...]:
+    return tuple(f"{metric}{window}" for metric in metrics for window in _ATTRIBUTION_WINDOWS)
+
+
+_AD_GROUP_COLUMNS = ("campaignName", "campaignId", "adGroupName", "adGroupId")
+_TRAFFIC_METRICS = ("impressions", "clicks", "cost")
+_SALES_METRICS = _windowed("purchases", "purchasesSameSku", "unitsSoldClicks", "sales", "attributedSalesSameSku", "unitsSoldSameSku")
+_PURCHASED_PRODUCT_METRICS = _windowed("unitsSoldClicks", "unitsSoldOtherSku", "salesOtherSku")
+
+_METRICS = {
+    "campaigns": (
         "campaignName",
         "campaignId",
         "campaignStatus",
@@ -17,229 +31,26 @@ METRICS_MAP = {
         "campaignRuleBasedBudgetAmount",
         "campaignApplicableBudgetRuleId",
         "campaignApplicableBudgetRuleName",
-        "impressions",
-        "clicks",
-        "cost",
-        "purchases1d",
-        "purchases7d",
-        "purchases14d",
-        "purchases30d",
-        "purchasesSameSku1d",
-        "purchasesSameSku7d",
-        "purchasesSameSku14d",
-        "purchasesSameSku30d",
-        "unitsSoldClicks1d",
-        "unitsSoldClicks7d",
-        "unitsSoldClicks14d",
-        "unitsSoldClicks30d",
-        "sales1d",
-        "sales7d",
-        "sales14d",
-        "sales30d",
-        "attributedSalesSameSku1d",
-        "attributedSalesSameSku7d",
-        "attributedSalesSameSku14d",
-        "attributedSalesSameSku30d",
-        "unitsSoldSameSku1d",
-        "unitsSoldSameSku7d",
-        "unitsSoldSameSku14d",
-        "unitsSoldSameSku30d",
-    ],
-    "adGroups": [
-        "campaignName",
-        "campaignId",
-        "adGroupName",
-        "adGroupId",
-        "impressions",
-        "clicks",
-        "cost",
-        "purchases1d",
-        "purchases7d",
-        "purchases14d",
-        "purchases30d",
-        "purchasesSameSku1d",
-        "purchasesSameSku7d",
-        "purchasesSameSku14d",
-        "purchasesSameSku30d",
-        "unitsSoldClicks1d",
-        "unitsSoldClicks7d",
-        "unitsSoldClicks14d",
-        "unitsSoldClicks30d",
-        "sales1d",
-        "sales7d",
-        "sales14d",
-        "sales30d",
-        "attributedSalesSameSku1d",
-        "attributedSalesSameSku7d",
-        "attributedSalesSameSku14d",
-        "attributedSalesSameSku30d",
-        "unitsSoldSameSku1d",
-        "unitsSoldSameSku7d",
-        "unitsSoldSameSku14d",
-        "unitsSoldSameSku30d",
-    ],
-    "keywords": [
-        "campaignName",
-        "campaignId",
-        "adGroupName",
-        "adGroupId",
-        "keywordId",
-        "keyword",
-        "matchType",
-        "impressions",
-        "clicks",
-        "cost",
-        "purchases1d",
-        "purchases7d",
-        "purchases14d",
-        "purchases30d",
-        "purchasesSameSku1d",
-        "purchasesSameSku7d",
-        "purchasesSameSku14d",
-        "purchasesSameSku30d",
-        "unitsSoldClicks1d",
-        "unitsSoldClicks7d",
-        "unitsSoldClicks14d",
-        "unitsSoldClicks30d",
-        "sales1d",
-        "sales7d",
-        "sales14d",
-        "sales30d",
-        "attributedSalesSameSku1d",
-        "attributedSalesSameSku7d",
-        "attributedSalesSameSku14d",
-        "attributedSalesSameSku30d",
-        "unitsSoldSameSku1d",
-        "unitsSoldSameSku7d",
-        "unitsSoldSameSku14d",
-        "unitsSoldSameSku30d",
-    ],
-    "targets": [
-        "campaignName",
-        "campaignId",
-        "adGroupName",
-        "adGroupId",
-        "keywordId",
-        "keyword",
-        "targeting",
-        "keywordType",
-        "impressions",
-        "clicks",
-        "cost",
-        "purchases1d",
-        "purchases7d",
-        "purchases14d",
-        "purchases30d",
-        "purchasesSameSku1d",
-        "purchasesSameSku7d",
-        "purchasesSameSku14d",
-        "purchasesSameSku30d",
-        "unitsSoldClicks1d",
-        "unitsSoldClicks7d",
-        "unitsSoldClicks14d",
-        "unitsSoldClicks30d",
-        "sales1d",
-        "sales7d",
-        "sales14d",
-        "sales30d",
-        "attributedSalesSameSku1d",
-        "attributedSalesSameSku7d",
-        "attributedSalesSameSku14d",
-        "attributedSalesSameSku30d",
-        "unitsSoldSameSku1d",
-        "unitsSoldSameSku7d",
-        "unitsSoldSameSku14d",
-        "unitsSoldSameSku30d",
-    ],
-    "productAds": [
-        "campaignName",
-        "campaignId",
-        "adGroupName",
-        "adGroupId",
-        "adId",
-        "impressions",
-        "clicks",
-        "cost",
-        "campaignBudgetCurrencyCode",
-        "advertisedAsin",
-        "purchases1d",
-        "purchases7d",
-        "purchases14d",
-        "purchases30d",
-        "purchasesSameSku1d",
-        "purchasesSameSku7d",
-        "purchasesSameSku14d",
-        "purchasesSameSku30d",
-        "unitsSoldClicks1d",
-        "unitsSoldClicks7d",
-        "unitsSoldClicks14d",
-        "unitsSoldClicks30d",
-        "sales1d",
-        "sales7d",
-        "sales14d",
-        "sales30d",
-        "attributedSalesSameSku1d",
-        "attributedSalesSameSku7d",
-        "attributedSalesSameSku14d",
-        "attributedSalesSameSku30d",
-        "unitsSoldSameSku1d",
-        "unitsSoldSameSku7d",
-        "unitsSoldSameSku14d",
-        "unitsSoldSameSku30d",
-    ],
-    "asins_keywords": [
-        "campaignName",
-        "campaignId",
-        "adGroupName",
-        "adGroupId",
-        "keywordId",
-        "keyword",
-        "advertisedAsin",
-        "purchasedAsin",
-        "advertisedSku",
-        "campaignBudgetCurrencyCode",
-        "matchType",
-        "unitsSoldClicks1d",
-        "unitsSoldClicks7d",
-        "unitsSoldClicks14d",
-        "unitsSoldClicks30d",
-        "unitsSoldOtherSku1d",
-        "unitsSoldOtherSku7d",
-        "unitsSoldOtherSku14d",
-        "unitsSoldOtherSku30d",
-        "salesOtherSku1d",
-        "salesOtherSku7d",
-        "salesOtherSku14d",
-        "salesOtherSku30d",
-    ],
-    "asins_targets": [
-        "campaignName",
-        "campaignId",
-        "adGroupName",
-        "adGroupId",
-        "advertisedAsin",
-        "purchasedAsin",
-        "advertisedSku",
-        "campaignBudgetCurrencyCode",
-        "matchType",
-        "unitsSoldClicks1d",
-        "unitsSoldClicks7d",
-        "unitsSoldClicks14d",
-        "unitsSoldClicks30d",
-        "unitsSoldOtherSku1d",
-        "unitsSoldOtherSku7d",
-        "unitsSoldOtherSku14d",
-        "unitsSoldOtherSku30d",
-        "salesOtherSku1d",
-        "salesOtherSku7d",
-        "salesOtherSku14d",
-        "salesOtherSku30d",
-        "keywordId",
-        "targeting",
-        "keywordType",
-    ],
+    )
+    + _TRAFFIC_METRICS
+    + _SALES_METRICS,
+    "adGroups": _AD_GROUP_COLUMNS + _TRAFFIC_METRICS + _SALES_METRICS,
+    "keywords": _AD_GROUP_COLUMNS + ("keywordId", "keyword", "matchType") + _TRAFFIC_METRICS + _SALES_METRICS,
+    "targets": _AD_GROUP_COLUMNS + ("keywordId", "keyword", "targeting", "keywordType") + _TRAFFIC_METRICS + _SALES_METRICS,
+    "productAds": _AD_GROUP_COLUMNS + ("adId",) + _TRAFFIC_METRICS + ("campaignBudgetCurrencyCode", "advertisedAsin") + _SALES_METRICS,
+    "asins_keywords": _AD_GROUP_COLUMNS
+    + ("keywordId", "keyword", "advertisedAsin", "purchasedAsin", "advertisedSku", "campaignBudgetCurrencyCode", "matchType")
+    + _PURCHASED_PRODUCT_METRICS,
+    "asins_targets": _AD_GROUP_COLUMNS
+    + ("advertisedAsin", "purchasedAsin", "advertisedSku", "campaignBudgetCurrencyCode", "matchType")
+    + _PURCHASED_PRODUCT_METRICS
+    + ("keywordId", "targeting", "keywordType"),
 }
 
+# Freeze the column lists once at import time: tuples are shared by every report
+# request and interning collapses column names repeated across record types.
+METRICS_MAP = MappingProxyType({record_type: tuple(map(sys.intern, metrics)) for record_type, metrics in _METRICS.items()})
+
 
 METRICS_TYPE_TO_ID_MAP = {
     "campaigns": "campaignId",
@@ -252,32 +63,14 @@ METRICS_TYPE_TO_ID_MAP = {
 }
 
 
-class SponsoredProductsReportStream(ReportStream):
+def _build_report_configurations(ad_product: str, metrics_map: Mapping[str, Tuple[str, ...]]) -> Mapping[str, Dict[str, Any]]:
     """
-    https://advertising.amazon.com/API/docs/en-us/sponsored-products/2-0/openapi#/Reports
-    https://advertising.amazon.com/API/docs/en-us/reporting/v3/migration-guide
-    https://advertising.amazon.com/API/docs/en-us/reporting/v3/report-types#sponsored-products
+    Build the report configuration for every record type once. Only the report
+    name and dates change between report requests, so the configuration blocks
+    are shared and must not be mutated.
     """
-
-    API_VERSION = "reporting"  # v3
-    REPORT_DATE_FORMAT = "YYYY-MM-DD"
-    ad_product = "SPONSORED_PRODUCTS"
-    report_is_created = HTTPStatus.OK
-    metrics_map = METRICS_MAP
-    metrics_type_to_id_map = METRICS_TYPE_TO_ID_MAP
-
-    def report_init_endpoint(self, record_type: str) -> str:
-        return f"/{self.API_VERSION}/reports"
-
-    def _download_report(self, report_info: ReportInfo, url: str) -> List[dict]:
-        """
-        Download and parse report result
-        """
-        return super()._download_report(None, url)
-
-    def _get_init_report_body(self, report_date: str, record_type: str, profile):
-        metrics_list = self.metrics_map[record_type]
-
+    configurations = {}
+    for record_type, metrics_list in metrics_map.items():
         reportTypeId = "spCampaigns"
         group_by = ["campaign"]
         filters = []
@@ -301,19 +94,46 @@ class SponsoredProductsReportStream(ReportStream):
             if record_type == "keywords":
                 filters = [{"field": "keywordType", "values": ["BROAD", "PHRASE", "EXACT"]}]
 
-        body = {
+        configurations[record_type] = {
+            "adProduct": ad_product,
+            "groupBy": group_by,
+            "columns": metrics_list,
+            "reportTypeId": reportTypeId,
+            "filters": filters,
+            "timeUnit": "SUMMARY",
+            "format": "GZIP_JSON",
+        }
+    return MappingProxyType(configurations)
+
+
+class SponsoredProductsReportStream(ReportStream):
+    """
+    https://advertising.amazon.com/API/docs/en-us/sponsored-products/2-0/openapi#/Reports
+    https://advertising.amazon.com/API/docs/en-us/reporting/v3/migration-guide
+    https://advertising.amazon.com/API/docs/en-us/reporting/v3/report-types#sponsored-products
+    """
+
+    API_VERSION = "reporting"  # v3
+    REPORT_DATE_FORMAT = "YYYY-MM-DD"
+    ad_product = "SPONSORED_PRODUCTS"
+    report_is_created = HTTPStatus.OK
+    metrics_map = METRICS_MAP
+    metrics_type_to_id_map = METRICS_TYPE_TO_ID_MAP
+    report_configurations = _build_report_configurations(ad_product, METRICS_MAP)
+
+    def report_init_endpoint(self, record_type: str) -> str:
+        return f"/{self.API_VERSION}/reports"
+
+    def _download_report(self, report_info: ReportInfo, url: str) -> List[dict]:
+        """
+        Download and parse report result
+        """
+        return super()._download_report(None, url)
+
+    def _get_init_report_body(self, report_date: str, record_type: str, profile):
+        yield {
             "name": f"{record_type} report {report_date}",
             "startDate": report_date,
             "endDate": report_date,
-            "configuration": {
-                "adProduct": self.ad_product,
-                "groupBy": group_by,
-                "columns": metrics_list,
-                "reportTypeId": reportTypeId,
-                "filters": filters,
-                "timeUnit": "SUMMARY",
-                "format": "GZIP_JSON",
-            },
+            "configuration": self.report_configurations[record_type],
         }
-
-        yield body